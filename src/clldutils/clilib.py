@@ -75,7 +75,6 @@ import pathlib
 import argparse
 import warnings
 import importlib
-import collections
 import importlib.metadata
 
 import tabulate
@@ -148,7 +147,7 @@ class ArgumentParser(argparse.ArgumentParser):
         kw.setdefault(
             'epilog', "Use '%(prog)s help <cmd>' to get help about individual commands.")
         super(ArgumentParser, self).__init__(**kw)
-        self.commands = collections.OrderedDict((_attr(cmd, 'name'), cmd) for cmd in commands)
+        self.commands = dict((_attr(cmd, 'name'), cmd) for cmd in commands)
         self.pkg_name = pkg_name
         self.add_argument("--verbosity", help="increase output verbosity")
         self.add_argument('command', help=' | '.join(self.commands))
@@ -280,7 +279,7 @@ def register_subcommands(
     """
     # Discover available commands:
     # Commands are identified by (<entry point name>).<module name>
-    _cmds = collections.OrderedDict()
+    _cmds = {}
     _cmds.update(list(iter_modules(pkg)))
     if entry_point:
         # ... then look for commands provided in other packages:
@@ -293,7 +292,7 @@ def register_subcommands(
             _cmds.update(
                 [('.'.join([ep.name, name]), mod) for name, mod in iter_modules(pkg)])
 
-    valid = collections.OrderedDict()
+    valid = {}
     for name, mod in _cmds.items():
         if not mod.__doc__:
             if skip_invalid:
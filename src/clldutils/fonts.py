@@ -16,41 +16,43 @@ from clldutils.html import HTML, literal
 __all__ = ['FONTS_DIR', 'charis_font_spec_css', 'charis_font_spec_html']
 
 FONTS_DIR = pathlib.Path(__file__).parent / 'fonts'
-
-
-def charis_font_spec_css() -> str:
-    """
-    Font spec for using CharisSIL with Pisa (xhtml2pdf).
-
-    If included, a `font-family` named "charissil" is defined.
-
-    The paths inserted for the font files are absolute, local paths which can be resolved as
-    links by `xhtml2pdf`. If you use a custom
-    `link_callback <https://xhtml2pdf.readthedocs.io/en/latest/reference.html#link-callback>`_
-    with `pisa.CreatePDF`, make sure to return unhandled `src_attr` arguments as is.
-    """
-    return """
+_FONTS_URI = FONTS_DIR.resolve()
+_CHARIS_FONT_SPEC_CSS = f"""
     @font-face {{
         font-family: 'charissil';
-        src: url('{0}/CharisSIL-Regular.ttf');
+        src: url('{_FONTS_URI}/CharisSIL-Regular.ttf');
     }}
     @font-face {{
         font-family: 'charissil';
         font-style: italic;
-        src: url('{0}/CharisSIL-Italic.ttf');
+        src: url('{_FONTS_URI}/CharisSIL-Italic.ttf');
     }}
     @font-face {{
         font-family: 'charissil';
         font-weight: bold;
-        src: url('{0}/CharisSIL-Bold.ttf');
+        src: url('{_FONTS_URI}/CharisSIL-Bold.ttf');
     }}
     @font-face {{
         font-family: 'charissil';
         font-weight: bold;
         font-style: italic;
-        src: url('{0}/CharisSIL-BoldItalic.ttf');
+        src: url('{_FONTS_URI}/CharisSIL-BoldItalic.ttf');
     }}
-""".format(FONTS_DIR.resolve())
+"""
+
+
+def charis_font_spec_css() -> str:
+    """
+    Font spec for using CharisSIL with Pisa (xhtml2pdf).
+
+    If included, a `font-family` named "charissil" is defined.
+
+    The paths inserted for the font files are absolute, local paths which can be resolved as
+    links by `xhtml2pdf`. If you use a custom
+    `link_callback <https://xhtml2pdf.readthedocs.io/en/latest/reference.html#link-callback>`_
+    with `pisa.CreatePDF`, make sure to return unhandled `src_attr` arguments as is.
+    """
+    return _CHARIS_FONT_SPEC_CSS
 
 
 def charis_font_spec_html() -> HTML:
@@ -4,7 +4,6 @@ writer based on the standard library's
 `configparser <https://docs.python.org/3/library/configparser.html>`_ .
 """
 import io
-import re
 import pathlib
 import configparser
 
@@ -15,7 +14,8 @@ class INI(configparser.ConfigParser):
     """
     @staticmethod
     def format_list(items):
-        return ''.join('\n' + item for item in items)
+        items = list(items)
+        return '\n' + '\n'.join(items) if items else ''
 
     @classmethod
     def from_file(cls, fname, encoding='utf-8', **kw) -> 'INI':
@@ -59,17 +59,17 @@ class INI(configparser.ConfigParser):
         prepended to lines starting with whitespace in :meth:`INI.settext` and stripped in
         :meth:`INI.gettext` .
         """
-        lines = []
+        lines, n = [], len(whitespace_preserving_prefix)
         for line in self.get(section, option, fallback='').splitlines():
-            if re.match(re.escape(whitespace_preserving_prefix) + r'\s+', line):
-                line = line[len(whitespace_preserving_prefix):]
+            if line.startswith(whitespace_preserving_prefix) and line[n:n + 1].isspace():
+                line = line[n:]
             lines.append(line)
         return '\n'.join(lines)
 
     def settext(self, section, option, value, whitespace_preserving_prefix='.'):
         lines = []
         for line in value.splitlines():
-            if re.match(r'\s+', line):
+            if line[:1].isspace():
                 line = whitespace_preserving_prefix + line
             lines.append(line)
         self.set(section, option, '\n'.join(lines))
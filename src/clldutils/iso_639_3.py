@@ -41,31 +41,49 @@ def _open(path):
         urllib.request.Request(BASE_URL + path, headers={'User-Agent': USER_AGENT}))
 
 
+@functools.lru_cache(maxsize=None)
+def _parse_iso_date(s: str) -> datetime.date:
+    """
+    Parse a date formatted as YYYY-MM-DD.
+    """
+    return datetime.date(int(s[0:4]), int(s[5:7]), int(s[8:10]))
+
+
+def _parse_datestamp(s: str) -> datetime.date:
+    """
+    Parse a date stamp formatted as YYYYMMDD.
+    """
+    return datetime.date(int(s[0:4]), int(s[4:6]), int(s[6:8]))
+
+
 def iterrows(lines):
     header = None
     for i, row in enumerate(csv.reader(io.StringIO('\n'.join(lines)), delimiter='\t')):
         if i == 0:
             header = row
         else:
-            yield collections.OrderedDict(zip(header, row))
+            yield dict(zip(header, row))
+
+
+def _table_name(name_and_date: str) -> str:
+    """
+    Derive the table name from the name-and-date part of a table's file name.
+    """
+    name = '_'.join([p for p in name_and_date.split('_') if not DATESTAMP_PATTERN.match(p)])
+    if name.startswith(('_', '-')):
+        name = name[1:]
+    return name or 'Codes'
 
 
 class Table(list):
 
     def __init__(self, name_and_date, date, fp):
-        parts = name_and_date.split('_')
         # The ISO 639-3 code tables from 2020-05-15 contain a table with a
         # malformed name - having an excess "0" in the date stamp.
-        if parts[-1] == '202000515':  # pragma: no cover
+        if name_and_date.split('_')[-1] == '202000515':  # pragma: no cover
             date = '20200515'
-        digits = map(int, DATESTAMP_PATTERN.match(date).groups())
-        self.date = datetime.date(*digits)
-        name = '_'.join([p for p in parts if not DATESTAMP_PATTERN.match(p)])
-        if name.startswith(('_', '-')):
-            name = name[1:]
-        if not name:
-            name = 'Codes'
-        self.name = name
+        self.date = _parse_datestamp(date)
+        self.name = _table_name(name_and_date)
         super(Table, self).__init__(list(iterrows(
             [line for line in fp.splitlines() if line.strip()],  # strip malformed lines.
         )))
@@ -84,18 +102,26 @@ def download_tables(outdir=None) -> pathlib.Path:
     return target
 
 
-def iter_tables(zippath=None):
+def iter_tables(zippath=None, tables: typing.Optional[typing.Iterable[str]] = None):
+    """
+    Iterate over the tables in the zipped ISO code tables.
+
+    :param tables: Names of the tables to read. If `None`, all tables are read.
+    """
+    tables = set(tables) if tables is not None else None
     with TemporaryDirectory() as tmp:
         if not zippath:
             zippath = download_tables(tmp)
 
         with ZipArchive(zippath) as archive:
             for name in archive.namelist():
-                date = DATESTAMP_PATTERN.search(name)
-                date = name[date.start():date.end()]
                 match = TABLE_NAME_PATTERN.search(name)
                 if match:
-                    yield Table(match.group('name_and_date'), date, archive.read_text(name))
+                    name_and_date = match.group('name_and_date')
+                    if tables is not None and _table_name(name_and_date) not in tables:
+                        continue
+                    date = DATESTAMP_PATTERN.search(name).group()
+                    yield Table(name_and_date, date, archive.read_text(name))
 
 
 @functools.total_ordering
@@ -138,7 +164,7 @@ class Code(object):
         elif tablename == 'Retirements':
             self._scope = 'Retirement'
             self._type = self._rtype_map[item['Ret_Reason']] if item['Ret_Reason'] else None
-            self.retired = datetime.date(*map(int, item['Effective'].split('-')))
+            self.retired = _parse_iso_date(item['Effective'])
             if code in CHANGE_TO_ERRATA:
                 self._change_to = CHANGE_TO_ERRATA[code]  # pragma: no cover
             else:
@@ -223,7 +249,7 @@ class Code(object):
         return '{0} [{1}]'.format(self.name, self.code)
 
 
-class ISO(collections.OrderedDict):
+class ISO(dict):
     """
     Provides access to the content of ISO 639-3's downloadable code table.
 
@@ -247,10 +273,11 @@ class ISO(collections.OrderedDict):
         the tables will be retrieved from the web.
         """
         zippath = pathlib.Path(zippath) if zippath else None
-        self._tables = {t.name: t for t in iter_tables(zippath=zippath)}
-        if zippath and DATESTAMP_PATTERN.search(zippath.name):
-            digits = map(int, DATESTAMP_PATTERN.search(zippath.name).groups())
-            self.date = datetime.date(*digits)
+        self._tables = {t.name: t for t in iter_tables(
+            zippath=zippath, tables=('Codes', 'Retirements', 'macrolanguages'))}
+        datestamp = DATESTAMP_PATTERN.search(zippath.name) if zippath else None
+        if datestamp:
+            self.date = _parse_datestamp(datestamp.group())
         else:
             self.date = max(t.date for t in self._tables.values())
         self._macrolanguage = collections.defaultdict(list)
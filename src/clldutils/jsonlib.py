@@ -19,19 +19,53 @@ functions :func:`format` and :func:`parse` as follows:
     >>> parse(json.loads(json.dumps({'start': datetime.now(), 'end': 5}, cls=DateTimeEncoder)))
     {'start': datetime.datetime(2022, 12, 15, 14, 33, 17, 323973), 'end': 5}
 """
+import os
 import re
 import json
+import shutil
+import tempfile
 import pathlib
 import datetime
+import functools
 import contextlib
 import collections
 import typing
+import asyncio
+import concurrent.futures
 
 import dateutil.parser
 
-__all__ = ['parse', 'format', 'dump', 'load', 'update', 'update_ordered']
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+__all__ = [
+    'parse', 'format', 'dump', 'load', 'adump', 'aload', 'load_threaded', 'update',
+    'update_ordered']
 
 DATETIME_ISO_FORMAT = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}\.[0-9]+')
+_match_iso_timestamp = DATETIME_ISO_FORMAT.match
+# json.dump issues many small writes, so we write files through a large buffer:
+_WRITE_BUFFER_SIZE = 1 << 20
+# Executor shared by all calls of `load_threaded`. Worker threads are only started when needed.
+_EXECUTOR = concurrent.futures.ThreadPoolExecutor(thread_name_prefix='clldutils.jsonlib')
+
+
+def _is_iso_timestamp(v) -> bool:
+    # Timestamps are at least 21 characters long, with fixed separators. Checking these first
+    # lets us reject most strings without running the regex.
+    return isinstance(v, str) \
+        and len(v) > 20 and v[10] == 'T' and v[4] == '-' \
+        and _match_iso_timestamp(v) is not None
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso(s: str) -> datetime.datetime:
+    try:
+        return datetime.datetime.fromisoformat(s)
+    except ValueError:  # E.g. fractional seconds with other than 3 or 6 digits on Python < 3.11.
+        return dateutil.parser.parse(s)
 
 
 def parse(d: dict) -> dict:
@@ -50,17 +84,21 @@ def parse(d: dict) -> dict:
     :return: A shallow copy of d with converted timestamps.
     """
     res = {}
-    for k, v in d.items():
-        if isinstance(v, str) and DATETIME_ISO_FORMAT.match(v):
-            v = dateutil.parser.parse(v)
-        elif isinstance(v, dict):
-            v = parse(v)
-        elif isinstance(v, list):
-            v = [
-                dateutil.parser.parse(vv)
-                if isinstance(vv, str) and DATETIME_ISO_FORMAT.match(vv) else vv
-                for vv in v]
-        res[k] = v
+    # We walk nested dicts iteratively, keeping pairs of (source, copy) on a stack.
+    stack = [(d, res)]
+    while stack:
+        src, dst = stack.pop()
+        for k, v in src.items():
+            # Strings are the most common leaves, so we check for them first - and only once.
+            if isinstance(v, str):
+                if len(v) > 20 and v[10] == 'T' and v[4] == '-' and _match_iso_timestamp(v):
+                    v = _parse_iso(v)
+            elif isinstance(v, dict):
+                stack.append((v, {}))
+                v = stack[-1][1]
+            elif isinstance(v, list):
+                v = [_parse_iso(vv) if _is_iso_timestamp(vv) else vv for vv in v]
+            dst[k] = v
     return res
 
 
@@ -69,36 +107,142 @@ def format(value):
     Format a value as ISO timestamp if it is a datetime.date(time) instance, otherwise return it
     unchanged.
     """
-    if isinstance(value, (datetime.date, datetime.datetime)):
+    # Note: datetime.datetime is a subclass of datetime.date, so a single check is enough.
+    if isinstance(value, datetime.date):
         return value.isoformat()
     return value
 
 
-def dump(obj, path: typing.Union[typing.TextIO, str, pathlib.Path], **kw):
+def _orjson_option(kw: dict) -> typing.Optional[int]:
+    """
+    Map keyword arguments for `json.dump` to `orjson` options - if `orjson` is available and can \
+    reproduce the output of `json.dump`.
+    """
+    if orjson is None or set(kw) - {'ensure_ascii', 'separators', 'default', 'indent', 'sort_keys'}:
+        return None
+    if kw.get('ensure_ascii', True):
+        return None
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | \
+        orjson.OPT_PASSTHROUGH_DATACLASS
+    indent, separators = kw.get('indent'), kw.get('separators')
+    if indent is None:
+        if tuple(separators or ()) != (',', ':'):
+            return None
+    elif indent in (2, '  ') and tuple(separators or (',', ': ')) == (',', ': '):
+        if os.linesep != '\n':  # pragma: no cover
+            return None  # json.dump would write platform-specific newlines in text mode.
+        option |= orjson.OPT_INDENT_2
+    else:  # orjson only supports indentation with two spaces.
+        return None
+    if kw.get('sort_keys'):
+        option |= orjson.OPT_SORT_KEYS
+    return option
+
+
+def dump(
+        obj,
+        path: typing.Union[typing.TextIO, str, pathlib.Path],
+        use_orjson: bool = False,
+        **kw):
     """`json.dump` which understands filenames.
 
     :param obj: The object to be dumped.
     :param path: The path of the JSON file to be written.
+    :param use_orjson: Flag signaling whether to serialize with \
+    `orjson <https://pypi.org/project/orjson/>`_ - if it is installed (e.g. via \
+    `pip install clldutils[orjson]`), `path` is a filename and \
+    non-ASCII output is requested, which is either compact - i.e. \
+    `ensure_ascii=False, separators=(',', ':')` - or indented by two spaces - i.e. \
+    `ensure_ascii=False, indent=2` (`sort_keys` is supported as well). Note that the output \
+    may differ from the output of `json.dump`: `orjson` serializes `NaN` and `Infinity` as \
+    `null`, writes negative float exponents without padding (e.g. `1e-7` rather than \
+    `1e-07`) and serializes enums and UUIDs natively, i.e. without calling `default`.
     :param kw: Keyword parameters are passed to json.dump
     """
     if isinstance(path, (str, pathlib.Path)):
-        with pathlib.Path(path).open('w', encoding='utf-8') as fp:
+        option = _orjson_option(kw) if use_orjson else None
+        if option is not None:
+            try:
+                data = orjson.dumps(obj, default=kw.get('default'), option=option)
+            except orjson.JSONEncodeError:
+                pass  # We let json.dump handle - or report - what orjson can't serialize.
+            else:
+                # orjson returns UTF-8 encoded bytes, so we can skip the text layer.
+                pathlib.Path(path).write_bytes(data)
+                return
+        with pathlib.Path(path).open(
+                'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as fp:
             return json.dump(obj, fp, **kw)
     return json.dump(obj, path, **kw)
 
 
-def load(path: typing.Union[typing.TextIO, str, pathlib.Path], **kw):
+def _parse_dates_hook(d: dict) -> dict:
+    """
+    An `object_hook` converting ISO formatted timestamps in a JSON object, while it is decoded.
+    """
+    for k, v in d.items():
+        if _is_iso_timestamp(v):
+            d[k] = _parse_iso(v)
+        elif isinstance(v, list):
+            for i, vv in enumerate(v):
+                if _is_iso_timestamp(vv):
+                    v[i] = _parse_iso(vv)
+    return d
+
+
+def load(path: typing.Union[typing.TextIO, str, pathlib.Path], parse_dates: bool = False, **kw):
     """`json.load` which understands filenames.
 
+    :param parse_dates: Flag signaling whether to convert ISO formatted timestamps to `datetime` \
+    objects (like :func:`parse`, but while decoding, thus saving a second pass over the data).
     :param kw: Keyword parameters are passed to json.load
     :return: The python object read from path.
     """
+    if parse_dates:
+        kw.setdefault('object_hook', _parse_dates_hook)
     if isinstance(path, (str, pathlib.Path)):
+        if not kw:
+            # Parse the raw bytes, without decoding to `str` first.
+            return json.loads(pathlib.Path(path).read_bytes())
         with pathlib.Path(path).open(encoding='utf-8') as fp:
             return json.load(fp, **kw)
     return json.load(path, **kw)
 
 
+async def adump(obj, path: typing.Union[typing.TextIO, str, pathlib.Path], **kw):
+    """
+    Coroutine running :func:`dump` in the event loop's default executor, i.e. without blocking \
+    the event loop.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        None, functools.partial(dump, obj, path, **kw))
+
+
+async def aload(path: typing.Union[typing.TextIO, str, pathlib.Path], **kw):
+    """
+    Coroutine running :func:`load` in the event loop's default executor, i.e. without blocking \
+    the event loop.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        None, functools.partial(load, path, **kw))
+
+
+def load_threaded(
+        path: typing.Union[typing.TextIO, str, pathlib.Path], **kw) -> concurrent.futures.Future:
+    """
+    Run :func:`load` in a shared thread pool, e.g. to read several files concurrently from \
+    synchronous code.
+
+    .. code-block:: python
+
+        >>> futures = [load_threaded(p) for p in paths]
+        >>> objs = [f.result() for f in futures]
+
+    :return: A `concurrent.futures.Future` for the python object read from path.
+    """
+    return _EXECUTOR.submit(load, path, **kw)
+
+
 @contextlib.contextmanager
 def update(path, default=None, load_kw=None, **kw):
     """
@@ -112,7 +256,8 @@ def update(path, default=None, load_kw=None, **kw):
         >>> load('/tmp/t.json')['x']
         5
     """
-    path = pathlib.Path(path)
+    # We resolve symlinks, to replace the link target rather than the link.
+    path = pathlib.Path(path).resolve()
     if not path.exists():
         if default is None:
             raise ValueError('path does not exist')
@@ -120,7 +265,29 @@ def update(path, default=None, load_kw=None, **kw):
     else:
         res = load(path, **(load_kw or {}))
     yield res
-    dump(res, path, **kw)
+    # Write to a temporary file first and then replace the original, so that readers never see
+    # a partially written file.
+    # The temporary file has a unique name, so that concurrent updates do not interfere.
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=path.name + '.', suffix='.tmp')
+    os.close(fd)
+    tmp = pathlib.Path(tmp)
+    try:
+        dump(res, tmp, **kw)
+        if path.exists():
+            shutil.copymode(path, tmp)
+        else:  # mkstemp creates files readable by the owner only.
+            os.chmod(tmp, 0o666 & ~_umask())
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def _umask() -> int:
+    # The umask can only be read by setting it:
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
 
 
 def update_ordered(path, **kw):
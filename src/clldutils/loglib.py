@@ -26,7 +26,8 @@ def get_colorlog(name, stream=None, level=logging.INFO) -> logging.Logger:
     """
     Get a logger set up with `colorlog`'s formatter.
     """
-    logging.basicConfig(level=level)
+    if not logging.root.handlers:  # `basicConfig` would be a no-op anyway, but takes a lock.
+        logging.basicConfig(level=level)
     handler = colorlog.StreamHandler(stream)
     handler.setFormatter(colorlog.ColoredFormatter(
         '%(log_color)s%(levelname)-7s%(reset)s %(message)s'))
@@ -46,23 +47,23 @@ class Logging(object):
         self.level = level
         self.logger = logger
         self.prev_level = self.logger.getEffectiveLevel()
-        root = logging.getLogger()
-        self.root_logger_level = root.getEffectiveLevel()
-        self.root_handler_level = root.handlers[0].level if root.handlers else logging.WARNING
+        self._root = logging.getLogger()
+        self._root_handler = self._root.handlers[0] if self._root.handlers else None
+        self.root_logger_level = self._root.getEffectiveLevel()
+        self.root_handler_level = \
+            self._root_handler.level if self._root_handler else logging.WARNING
 
     def __enter__(self):
         self.logger.setLevel(self.level)
         if self.logger.handlers:
             self.logger.handlers[0].setLevel(self.level)
-        root = logging.getLogger()
-        root.setLevel(self.level)
-        if root.handlers:
-            root.handlers[0].setLevel(self.level)
+        self._root.setLevel(self.level)
+        if self._root_handler:
+            self._root_handler.setLevel(self.level)
         return self.logger
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.logger.setLevel(self.prev_level)
-        root = logging.getLogger()
-        root.setLevel(self.root_logger_level)
-        if root.handlers:
-            root.handlers[0].setLevel(self.root_handler_level)
+        self._root.setLevel(self.root_logger_level)
+        if self._root_handler:
+            self._root_handler.setLevel(self.root_handler_level)
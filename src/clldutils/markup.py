@@ -1,14 +1,13 @@
 import io
 import re
-import csv
 import sys
+import functools
 import typing
+import html.parser
 import urllib.parse
 
 import attr
 from tabulate import tabulate
-from markdown import markdown
-from lxml import etree
 
 from clldutils.misc import slug
 from clldutils.text import replace_pattern
@@ -18,6 +17,18 @@ __all__ = [
     'iter_markdown_tables', 'iter_markdown_sections', 'add_markdown_text',
     'MarkdownLink', 'MarkdownImageLink']
 
+# Whitespace padding around column content in tables rendered with tablefmt "pipe":
+_PIPE_LPAD = re.compile(r'\|[ ]+')
+_PIPE_RPAD = re.compile(r'[ ]+\|')
+# Separator line between header and body of a markdown table:
+_TABLE_SEP_RE = re.compile(r'\s*\|?\s*:?--(-)+:?\s*(\|\s*:?--(-)+:?\s*)+\|?\s*')
+# Markdown link or - if prefixed with "!" - image link:
+_LINK_OR_IMAGE = re.compile(r'(?P<img>!)?\[(?P<label>[^]]*)]\((?P<url>[^)]+)\)')
+# Names of the components of a URL as returned by `urllib.parse.urlparse`:
+_URL_PARTS = ('scheme', 'netloc', 'path', 'params', 'query', 'fragment')
+# Markdown texts up to this length are cached when converted to HTML in `MarkdownLink.replace`:
+_MARKDOWN_CACHE_MAX_SIZE = 1 << 20
+
 
 class Table(list):
     """
@@ -73,12 +84,12 @@ class Table(list):
         tab_kw.update(kw)
         if tab_kw['tablefmt'] == 'tsv':
             res = io.StringIO()
+            import csv  # Only needed here, so we defer the import.
+
             w = csv.writer(res, delimiter='\t')
             w.writerow(self.columns)
-            for row in (sorted(self, key=sortkey, reverse=reverse) if sortkey else self):
-                w.writerow(row)
-            res.seek(0)
-            res = res.read()
+            w.writerows(sorted(self, key=sortkey, reverse=reverse) if sortkey else self)
+            res = res.getvalue()
             if res.endswith('\r\n'):
                 res = res[:-2]
             return res
@@ -87,8 +98,8 @@ class Table(list):
         if tab_kw['tablefmt'] == 'pipe':
             if condensed:
                 # remove whitespace padding around column content:
-                res = re.sub(r'\|[ ]+', '| ', res)
-                res = re.sub(r'[ ]+\|', ' |', res)
+                res = _PIPE_LPAD.sub('| ', res)
+                res = _PIPE_RPAD.sub(' |', res)
             if verbose:
                 res += '\n\n(%s rows)\n\n' % len(self)
         return res
@@ -109,38 +120,38 @@ def iter_markdown_tables(text) -> \
     :return: generator of (header, rows) pairs, where "header" is a `list` of column names and \
     rows is a list of lists of row values.
     """
-    def split_row(line, outer_pipes):
-        line = line.strip()
-        if outer_pipes:
-            assert line.startswith('|') and line.endswith('|'), 'inconsistent table formatting'
-            line = line[1:-1].strip()
-        return [c.strip() for c in line.split('|')]
-
     for header, rows, outer_pipes in _iter_table_blocks(text.splitlines()):
-        yield split_row(header, outer_pipes), [split_row(row, outer_pipes) for row in rows]
+        yield _split_row(header, outer_pipes), [_split_row(row, outer_pipes) for row in rows]
+
+
+def _split_row(line, outer_pipes):
+    line = line.strip()
+    if outer_pipes:
+        assert line.startswith('|') and line.endswith('|'), 'inconsistent table formatting'
+        line = line[1:-1].strip()
+    return [c.strip() for c in line.split('|')]
 
 
 def _iter_table_blocks(lines):
     # Tables are detected by
     # 1. A header line, i.e. a line with at least one `|`
-    # 2. A line separating header and body of the form below
-    SEP = re.compile(r'\s*\|?\s*:?--(-)+:?\s*(\|\s*:?--(-)+:?\s*)+\|?\s*')
-
-    lines = list(lines)
-    header, table, outer_pipes = None, [], False
-    for i, line in enumerate(lines):
+    # 2. A line separating header and body of the form specified by _TABLE_SEP_RE
+    header, table, outer_pipes, prev = None, [], False, None
+    for line in lines:
         if header:
             if '|' not in line:
                 if table:
                     yield header, table, outer_pipes
                 header, table, outer_pipes = None, [], False
             else:
-                if not SEP.fullmatch(line):
+                if not _TABLE_SEP_RE.fullmatch(line):
                     table.append(line)
         else:
-            if '|' in line and len(lines) > i + 1 and SEP.fullmatch(lines[i + 1]):
-                header = line
-                outer_pipes = lines[i + 1].strip().startswith('|')
+            # We look back rather than ahead, to be able to process the lines in one pass:
+            if prev and '|' in prev and _TABLE_SEP_RE.fullmatch(line):
+                header = prev
+                outer_pipes = line.strip().startswith('|')
+        prev = line
     if table:
         yield header, table, outer_pipes
 
@@ -156,18 +167,16 @@ def iter_markdown_sections(text) -> typing.Generator[typing.Tuple[int, str, str]
     "header" is the exact section heading (including "#"s and newline) or `None` and \
     "content" the markdown text of the section.
     """
-    section_pattern = re.compile(r'(?P<level>[#]+)')
-    lines, header, level = [], None, None
-    for line in text.splitlines(keepends=True):
-        match = section_pattern.match(line)
-        if match:
-            if lines:
-                yield level, header, ''.join(lines)
-            lines, header, level = [], line, len(match.group('level'))
-        else:
-            lines.append(line)
-    if lines or header:
-        yield level, header, ''.join(lines)
+    lines = text.splitlines(keepends=True)
+    # The content of the current section is lines[start:i]:
+    start, header, level = 0, None, None
+    for i, line in enumerate(lines):
+        if line.startswith('#'):
+            if i > start:
+                yield level, header, ''.join(lines[start:i])
+            start, header, level = i + 1, line, len(line) - len(line.lstrip('#'))
+    if len(lines) > start or header:
+        yield level, header, ''.join(lines[start:])
 
 
 def add_markdown_text(text: str,
@@ -206,7 +215,79 @@ def add_markdown_text(text: str,
     return res
 
 
-@attr.s
+@functools.lru_cache(maxsize=32)
+def _cached_markdown(md, kw_items):
+    return _markdown_to_html(md, **dict(kw_items))
+
+
+def _markdown_to_html(md, **kw):
+    # Importing markdown takes some time, so we defer it until it's actually needed.
+    from markdown import markdown
+
+    return markdown(md, **kw)
+
+
+def _markdown(md: str, markdown_kw: dict) -> str:
+    """
+    Convert markdown to HTML, caching the result, since texts are often processed repeatedly, e.g.
+    with `MarkdownLink.replace` and `MarkdownImageLink.replace`.
+    """
+    if len(md) <= _MARKDOWN_CACHE_MAX_SIZE:
+        try:
+            key = tuple(sorted(
+                (k, tuple(v) if isinstance(v, list) else v) for k, v in markdown_kw.items()))
+            hash(key)
+        except TypeError:  # Unhashable keyword arguments, e.g. `extension_configs`.
+            pass
+        else:
+            return _cached_markdown(md, key)
+    return _markdown_to_html(md, **markdown_kw)
+
+
+@functools.lru_cache(maxsize=1024)
+def _urlparse(url: str) -> urllib.parse.ParseResult:
+    """
+    Parse a URL, caching the result, since the URL of a link is often parsed repeatedly, e.g. in
+    `MarkdownLink.update_url`.
+    """
+    return urllib.parse.urlparse(url)
+
+
+class _LinkCollector(html.parser.HTMLParser):
+    """
+    Collects (text, attribute value) pairs for all elements `tag` in an HTML document.
+
+    .. note:: The text of an element is the concatenated text content of all its descendants.
+    """
+    def __init__(self, tag, attrib):
+        super().__init__()
+        self.tag, self.attrib = tag, attrib
+        self.links, self._open = [], []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == self.tag:
+            link = [[], dict(attrs).get(self.attrib)]
+            self.links.append(link)
+            if tag != 'img':  # `img` is a void element, i.e. has no content.
+                self._open.append(link)
+
+    def handle_endtag(self, tag):
+        if tag == self.tag and self._open:
+            self._open.pop()
+
+    def handle_data(self, data):
+        for text, _ in self._open:
+            text.append(data)
+
+    @classmethod
+    def collect(cls, html, tag, attrib):
+        parser = cls(tag, attrib)
+        parser.feed(html)
+        parser.close()
+        return [(''.join(text), value) for text, value in parser.links]
+
+
+@attr.s(slots=True)
 class MarkdownLink:
     """
     Functionality to detect and manipulate links in markdown text.
@@ -242,7 +323,7 @@ class MarkdownLink:
 
     @property
     def parsed_url(self):
-        return urllib.parse.urlparse(self.url)
+        return _urlparse(self.url)
 
     @property
     def parsed_url_query(self):
@@ -260,15 +341,72 @@ class MarkdownLink:
         old = self.parsed_url
         if ('query' in comps) and not isinstance(comps['query'], str):
             comps['query'] = urllib.parse.urlencode(comps['query'])
-        parts = [
-            comps.get(n, getattr(old, n))
-            for n in 'scheme netloc path params query fragment'.split()]
+        parts = [comps.get(n, getattr(old, n)) for n in _URL_PARTS]
         self.url = urllib.parse.urlunparse(parts)
         return self
 
     def __str__(self):
         return '[{0.label}]({0.url})'.format(self)
 
+    @classmethod
+    def replace_url(cls, md: str, repl: typing.Callable[[str], typing.Optional[str]]) -> str:
+        """
+        Replace the URLs of links in a markdown document.
+
+        This is a faster alternative to `MarkdownLink.replace` with `simple=True` for the common
+        case of rewriting URLs only, because no `MarkdownLink` objects are created.
+
+        :param md: Markdown text.
+        :param repl: A callable accepting a URL as sole argument, returning the replacement URL \
+        or `None` to leave the link unchanged.
+        :return: Updated markdown text
+
+        .. code-block:: python
+
+            >>> MarkdownLink.replace_url('[a](b) ![c](b)', lambda url: url + '.html')
+            '[a](b.html) ![c](b)'
+        """
+        def repl_url(m):
+            url = repl(m.group('url'))
+            if url is None:
+                return m.group(0)
+            start, end = m.span('url')
+            return m.string[m.start():start] + url + m.string[end:m.end()]
+
+        return cls.pattern.sub(repl_url, md)
+
+    @staticmethod
+    def replace_all(md: str,
+                    repl_link: typing.Optional[typing.Callable] = None,
+                    repl_image: typing.Optional[typing.Callable] = None) -> str:
+        """
+        Replace links and image links in a markdown document in one pass.
+
+        :param md: Markdown text.
+        :param repl_link: A callable accepting a `MarkdownLink` instance as sole argument, or \
+        `None` to leave links unchanged.
+        :param repl_image: A callable accepting a `MarkdownImageLink` instance as sole argument, \
+        or `None` to leave image links unchanged.
+        :return: Updated markdown text
+
+        .. note:: Link detection works as with `MarkdownLink.replace(..., simple=True)`.
+
+        .. code-block:: python
+
+            >>> print(MarkdownLink.replace_all(
+            ...     '[a](b) ![c](d)',
+            ...     lambda ml: ml.update_url(path='x'),
+            ...     lambda ml: ml.update_url(path='y')))
+            [a](x) ![c](y)
+        """
+        def repl_any(m):
+            cls, repl = (MarkdownImageLink, repl_image) if m.group('img') \
+                else (MarkdownLink, repl_link)
+            replacement = repl(cls(label=m.group('label'), url=m.group('url'))) if repl else None
+            return m.group(0) if replacement is None else str(replacement)
+
+        return _LINK_OR_IMAGE.sub(repl_any, md)
+
     @classmethod
     def replace(cls,
                 md: str,
@@ -359,39 +497,42 @@ class MarkdownLink:
 
                 [label](url)
        """
-        links = []
-        if not simple:
-            # We convert the markdown text to HTML and extract the links:
-            tree = etree.parse(io.StringIO(markdown(md, **markdown_kw or {})), etree.HTMLParser())
-            tag, attrib = cls.html_link
-            for node in tree.xpath('.//' + tag):
-                links.append((slug(''.join(node.itertext())), node.get(attrib)))
-            links = list(reversed(links))
-            print(links)
+        if not cls.pattern.search(md):
+            # No link candidates, thus no need to run the (expensive) markdown conversion.
+            return md
 
-        def repl_wrapper(m):
-            if not simple:
-                if not links:
-                    # We got them all.
-                    yield m.string[m.start():m.end()]
-                    return
-                # See which link is next.
-                label, url = links[-1]
-                # Does the current link candidate match what is expected?
-                if (label and (slug(m.group('label')) not in label)) or m.group('url') != url:
-                    yield m.string[m.start():m.end()]
-                    return
-                links.pop()
+        def repl_simple(m):
             replacement = repl(cls.from_match(m))
-            if replacement is not None:
-                yield str(replacement)
-            else:
+            return m.group(0) if replacement is None else str(replacement)
+
+        if simple:
+            return cls.pattern.sub(repl_simple, md)
+
+        # We convert the markdown text to HTML and extract the links:
+        links = (
+            (slug(text), url) for text, url in
+            _LinkCollector.collect(_markdown(md, markdown_kw or {}), *cls.html_link))
+        expected = next(links, None)
+
+        def repl_wrapper(m):
+            nonlocal expected
+            if expected is None:
+                # We got them all.
+                yield m.string[m.start():m.end()]
+                return
+            # See which link is next.
+            label, url = expected
+            # Does the current link candidate match what is expected?
+            if (label and (slug(m.group('label')) not in label)) or m.group('url') != url:
                 yield m.string[m.start():m.end()]
+                return
+            expected = next(links, None)
+            yield repl_simple(m)
 
         return replace_pattern(cls.pattern, repl_wrapper, md)
 
 
-@attr.s
+@attr.s(slots=True)
 class MarkdownImageLink(MarkdownLink):
     pattern = re.compile(r'!\[(?P<label>[^]]*)]\((?P<url>[^)]+)\)')
     html_link = ('img', 'src')
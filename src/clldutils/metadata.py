@@ -19,6 +19,7 @@ Usage:
     >>> Metadata.from_jsonld(md.to_jsonld()).publisher.place
     'anywhere'
 """
+import functools
 import collections
 import urllib.parse
 
@@ -53,6 +54,12 @@ class Publisher:
         default=None)
 
 
+@functools.lru_cache(maxsize=128)
+def _find_license(name):
+    # Only a handful of licenses are used in practice, so we cache the lookup.
+    return licenses.find(name)
+
+
 @attr.s
 class License:
     """
@@ -66,12 +73,21 @@ class License:
         default="cc-by.png")
 
     def __attrs_post_init__(self):
-        lic = licenses.find(self.name)
+        lic = _find_license(self.name)
         if lic:
             self.name = lic.name
             self.url = lic.url
 
 
+# For the objects nested in `Metadata`: (JSON-LD key, class, attribute name, fields), where fields
+# are triples (attribute name, JSON-LD key, key in `defaults` for `Metadata.from_jsonld`):
+_LDOBJECTS = tuple(
+    (ldkey, cls, ldkey.split(':')[1], tuple(
+        (f.name, f.metadata.get('ldkey', f.name), '{0}.{1}'.format(ldkey.split(':')[1], f.name))
+        for f in attr.fields(cls)))
+    for ldkey, cls in [('dc:publisher', Publisher), ('dc:license', License)])
+
+
 @attr.s
 class Metadata:
     """
@@ -83,8 +99,10 @@ class Metadata:
     :ivar str title: The title of the dataset.
     :ivar str description:
     """
-    publisher = attr.ib(default=Publisher(), validator=attr.validators.instance_of(Publisher))
-    license = attr.ib(default=License(), validator=attr.validators.instance_of(License))
+    publisher = attr.ib(
+        default=attr.Factory(Publisher), validator=attr.validators.instance_of(Publisher))
+    license = attr.ib(
+        default=attr.Factory(License), validator=attr.validators.instance_of(License))
     url = attr.ib(default=None)
     title = attr.ib(default=None)
     description = attr.ib(default=None)
@@ -101,13 +119,12 @@ class Metadata:
             val = d.get(k) or defaults.get(v)
             if val:
                 kw[v] = val
-        for ldkey, cls_ in [('dc:publisher', Publisher), ('dc:license', License)]:
+        for ldkey, cls_, name, fields in _LDOBJECTS:
             ckw = {}
             dd = d.get(ldkey, {})
-            for f in attr.fields(cls_):
-                ckw[f.name] = dd.get(f.metadata.get('ldkey', f.name)) \
-                    or defaults.get('{0}.{1}'.format(ldkey.split(':')[1], f.name))
-            kw[cls_.__name__.lower()] = cls_(**{k: v for k, v in ckw.items() if v})
+            for fname, fldkey, default_key in fields:
+                ckw[fname] = dd.get(fldkey) or defaults.get(default_key)
+            kw[name] = cls_(**{k: v for k, v in ckw.items() if v})
         return cls(**kw)
 
     def to_jsonld(self) -> collections.OrderedDict:
@@ -123,15 +140,21 @@ class Metadata:
         ]:
             if getattr(self, v):
                 items.append((k, getattr(self, v)))
-        for ldkey, cls_ in [('dc:publisher', Publisher), ('dc:license', License)]:
-            obj = getattr(self, ldkey.split(':')[1])
+        for ldkey, _, name, fields in _LDOBJECTS:
+            obj = getattr(self, name)
             json = collections.OrderedDict()
-            for f in attr.fields(cls_):
-                if getattr(obj, f.name):
-                    json[f.metadata.get('ldkey', f.name)] = getattr(obj, f.name)
+            for fname, fldkey, _ in fields:
+                value = getattr(obj, fname)
+                if value:
+                    json[fldkey] = value
             items.append((ldkey, json))
         return collections.OrderedDict(items)
 
     @property
     def domain(self):
-        return urllib.parse.urlparse(self.url).netloc
+        return _netloc(self.url)
+
+
+@functools.lru_cache(maxsize=128)
+def _netloc(url):
+    return urllib.parse.urlparse(url).netloc
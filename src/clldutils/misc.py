@@ -6,12 +6,19 @@ functionality (:func:`lazyproperty`), formatting functions, etc.
 import re
 import base64
 import string
+import functools
 import typing
 import pathlib
 import warnings
 import mimetypes
 import unicodedata
 
+try:
+    from pybase64 import b64encode_as_string as _b64encode
+except ImportError:  # pragma: no cover
+    def _b64encode(s: bytes) -> str:
+        return base64.b64encode(s).decode()
+
 __all__ = [
     'data_url', 'log_or_raise', 'nfilter', 'to_binary', 'dict_merged', 'NoDefault', 'NO_DEFAULT',
     'xmlchars', 'format_size', 'UnicodeMixin', 'slug', 'encoded', 'lazyproperty',
@@ -24,11 +31,19 @@ def deprecated(msg):
     warnings.simplefilter('default', DeprecationWarning)
 
 
+# Base64 encodes 3 bytes as 4 characters. So encoding chunks of a multiple of 3 bytes separately
+# yields the same result as encoding all at once.
+_DATA_URL_CHUNK_SIZE = 3 * 2 ** 16
+
+
 def data_url(content: typing.Union[bytes, str, pathlib.Path], mimetype: str = None) -> str:
     """
     Returns content encoded as base64 Data URI. Useful to include (smallish) media resources
     in HTML pages.
 
+    .. note:: If `pybase64 <https://pypi.org/project/pybase64/>`_ is installed, it is used for \
+        faster base64 encoding.
+
     :param content: bytes or str or Path
     :param mimetype: mimetype of the content
     :return: `str` object (consisting only of ASCII, though)
@@ -38,13 +53,16 @@ def data_url(content: typing.Union[bytes, str, pathlib.Path], mimetype: str = No
     if isinstance(content, pathlib.Path):
         if not mimetype:
             mimetype = mimetypes.guess_type(content.name)[0]
+        # We encode the file in chunks, to not hold its content in memory multiple times.
+        res = ["data:{0};base64,".format(mimetype or 'application/octet-stream')]
         with content.open('rb') as fp:
-            content = fp.read()
-    else:
-        if isinstance(content, str):
-            content = content.encode('utf8')
+            for chunk in iter(functools.partial(fp.read, _DATA_URL_CHUNK_SIZE), b''):
+                res.append(_b64encode(chunk))
+        return ''.join(res)
+    if isinstance(content, str):
+        content = content.encode('utf8')
     return "data:{0};base64,{1}".format(
-        mimetype or 'application/octet-stream', base64.b64encode(content).decode())
+        mimetype or 'application/octet-stream', _b64encode(content))
 
 
 def log_or_raise(msg: str, log=None, level='warning', exception_cls=ValueError):
@@ -95,14 +113,11 @@ def dict_merged(d, _filter=None, **kw):
         >>> dict_merged({'a': 1}, b=2, c=3, _filter=lambda v: v > 2)
         {'a': 1, 'c': 3}
     """
-    def f(s):
-        if _filter:
-            return _filter(s)
-        return s is not None
     d = d or {}
-    for k, v in kw.items():
-        if f(v):
-            d[k] = v
+    if _filter:
+        d.update((k, v) for k, v in kw.items() if _filter(v))
+    else:
+        d.update((k, v) for k, v in kw.items() if v is not None)
     return d
 
 
@@ -117,6 +132,11 @@ class NoDefault(object):
 NO_DEFAULT = NoDefault()
 
 
+# Control characters which are not allowed in XML:
+_INVALID_XML_CHARS = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F]')
+_INVALID_XML_CHARS_TABLE = dict.fromkeys([*range(0x9), 0xb, 0xc, *range(0xe, 0x20)])
+
+
 def xmlchars(text: str) -> str:
     """Not all of UTF-8 is considered valid character data in XML ...
 
@@ -124,10 +144,10 @@ def xmlchars(text: str) -> str:
 
     .. seealso:: `<https://en.wikipedia.org/wiki/Valid_characters_in_XML>`_
     """
-    invalid = list(range(0x9))
-    invalid.extend([0xb, 0xc])
-    invalid.extend(range(0xe, 0x20))
-    return re.sub('|'.join('\\x%0.2X' % i for i in invalid), '', text)
+    if text.isascii():
+        # str.translate has a fast path for ASCII-only strings, but is slow otherwise.
+        return text.translate(_INVALID_XML_CHARS_TABLE)
+    return _INVALID_XML_CHARS.sub('', text)
 
 
 def format_size(num: int) -> str:
@@ -161,6 +181,11 @@ class UnicodeMixin(object):
         return self.__unicode__()
 
 
+_PUNCTUATION = str.maketrans('', '', string.punctuation)
+_WHITESPACE = re.compile(r'\s+')
+_SLUG = re.compile('[ A-Za-z0-9]*$')
+
+
 def slug(s: str, remove_whitespace: bool = True, lowercase: bool = True) -> str:
     """
     Condenses a string to contain only (lowercase) alphanumeric characters.
@@ -175,15 +200,20 @@ def slug(s: str, remove_whitespace: bool = True, lowercase: bool = True) -> str:
         >>> slug('Some words!', remove_whitespace=False)
         'some words'
     """
-    res = ''.join(c for c in unicodedata.normalize('NFD', s)
-                  if unicodedata.category(c) != 'Mn')
+    if s.isascii():  # Nothing to normalize, no combining characters to remove.
+        res = s
+    else:
+        # Note: `unicodedata.combining` cannot be used here, because the canonical combining class
+        # is 0 for some non-spacing marks and non-zero for some spacing marks.
+        category = unicodedata.category
+        res = ''.join([c for c in unicodedata.normalize('NFD', s)
+                       if c.isascii() or category(c) != 'Mn'])
     if lowercase:
         res = res.lower()
-    for c in string.punctuation:
-        res = res.replace(c, '')
-    res = re.sub(r'\s+', '' if remove_whitespace else ' ', res)
+    res = res.translate(_PUNCTUATION)
+    res = _WHITESPACE.sub('' if remove_whitespace else ' ', res)
     res = res.encode('ascii', 'ignore').decode('ascii')
-    assert re.match('[ A-Za-z0-9]*$', res)
+    assert _SLUG.match(res)
     return res
 
 
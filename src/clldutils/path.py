@@ -15,6 +15,7 @@ import pathlib
 import tempfile
 import importlib
 import contextlib
+import concurrent.futures
 import subprocess
 import typing
 import unicodedata
@@ -199,12 +200,24 @@ def walk(p, mode='all', **kw) -> typing.Generator[pathlib.Path, None, None]:
                 yield Path(dirpath).joinpath(fname)
 
 
+# Files bigger than this (in bytes) are memory mapped for computing md5 sums:
+_MD5_MMAP_THRESHOLD = 1 << 20
+
+
 def md5(p: typing.Union[pathlib.Path, str], bufsize: int = 32768) -> str:
     """
     Compute md5 sum of the content of a file.
     """
+    p = Path(p)
+    if p.stat().st_size > _MD5_MMAP_THRESHOLD:
+        # Hash big files in one call, without copying chunks into Python objects:
+        try:
+            with memorymapped(p) as m:
+                return hashlib.md5(m).hexdigest()
+        except (OSError, ValueError):  # pragma: no cover
+            pass  # Some files cannot be memory mapped, so we fall back to reading chunks.
     hash_md5 = hashlib.md5()
-    with Path(p).open('rb') as fp:
+    with p.open('rb') as fp:
         for chunk in iter(lambda: fp.read(bufsize), b''):
             hash_md5.update(chunk)
     return hash_md5.hexdigest()
@@ -220,10 +233,21 @@ class Manifest(dict):
     """
 
     @classmethod
-    def from_dir(cls, d, relative_to=None):
+    def from_dir(cls, d, relative_to=None, max_workers: typing.Optional[int] = None):
+        """
+        :param max_workers: Maximal number of threads used to compute md5 sums concurrently \
+        (`hashlib` releases the GIL while hashing). Defaults to the number of CPUs.
+        """
         d = Path(d)
         assert d.is_dir()
-        return cls((str(p.relative_to(relative_to or d)), md5(p)) for p in walk(d, mode='files'))
+        paths = list(walk(d, mode='files'))
+        max_workers = min(max_workers or os.cpu_count() or 1, len(paths))
+        if max_workers > 1:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                md5s = list(executor.map(md5, paths))
+        else:
+            md5s = [md5(p) for p in paths]
+        return cls((str(p.relative_to(relative_to or d)), m) for p, m in zip(paths, md5s))
 
     def __str__(self):
         return '\n'.join('{0}  {1}'.format(v, k) for k, v in sorted(self.items()))
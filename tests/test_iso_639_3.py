@@ -2,7 +2,7 @@ import io
 from shutil import copy
 from pathlib import Path
 
-from clldutils.iso_639_3 import ISO, Code
+from clldutils.iso_639_3 import ISO, Code, iter_tables
 
 FIXTURES = Path(__file__).parent.joinpath('fixtures')
 
@@ -43,3 +43,8 @@ def test_ISO(tmp_path):
 
 def test_zips(fixtures_dir):
     ISO(fixtures_dir / 'iso-639-3_Code_Tables_20210218.zip')
+
+
+def test_iter_tables():
+    assert len(list(iter_tables(FIXTURES / 'iso.zip'))) == 4
+    assert [t.name for t in iter_tables(FIXTURES / 'iso.zip', tables=['Codes'])] == ['Codes']
@@ -1,14 +1,34 @@
-from datetime import date
+import json
+import stat
+import asyncio
+import concurrent.futures
+import importlib.util
+import dataclasses
+from datetime import date, datetime
 
 import pytest
 
-from clldutils.jsonlib import dump, load, parse, update, format, update_ordered
+from clldutils.jsonlib import dump, load, parse, update, format, update_ordered, adump, aload
+from clldutils.jsonlib import load_threaded
 
 
 def test_parse_json_with_datetime():
     assert parse(dict(d='2012-12-12T20:12:12.12'))['d'].year
     assert parse(dict(d=dict(c='2012-12-12T20:12:12.12')))['d']['c'].year
     assert parse(dict(d=['2012-12-12T20:12:12.12']))['d'][0].year
+    assert parse(dict(d='2012-12-12T20:12:12.1234567'))['d'].microsecond == 123456
+    assert parse(dict(d='2012-12-12T20:12:12.12+01:00'))['d'].utcoffset().seconds == 3600
+    assert parse(dict(d='2012-12-12T20:12:12.12 UTC'))['d'].utcoffset().seconds == 0
+
+    d = c = {}
+    for _ in range(2000):
+        c['c'] = {}
+        c = c['c']
+    c['d'] = '2012-12-12T20:12:12.12'
+    res = parse(d)
+    for _ in range(2000):
+        res = res['c']
+    assert res['d'].year == 2012 and c['d'] == '2012-12-12T20:12:12.12'
 
 
 def test_update(tmp_path):
@@ -52,5 +72,178 @@ def test_json(tmp_path):
 
 
 def test_format_json():
-    format(date.today())
+    assert format(date(2012, 12, 12)) == '2012-12-12'
+    assert format(datetime(2012, 12, 12, 20, 12)) == '2012-12-12T20:12:00'
     assert format(5) == 5
+
+
+def test_load(tmp_path):
+    p = tmp_path / 'test.json'
+    p.write_text('{"a": [1, 2.5, null, true], "ä": "ö"}', encoding='utf8')
+    res = load(p)
+    assert res['a'] == [1, 2.5, None, True] and res['ä'] == 'ö'
+    p.write_text('{"n": NaN, "i": %s}' % (2 ** 70), encoding='utf8')
+    assert load(p)['i'] == 2 ** 70
+    p.write_text('{"a": 1', encoding='utf8')
+    with pytest.raises(ValueError):
+        load(p)
+
+
+def test_load_big_int(tmp_path):
+    p = tmp_path / 'test.json'
+    p.write_text('{"id": 12345678901234567890123}', encoding='utf8')
+    assert load(p)['id'] == 12345678901234567890123
+    with p.open(encoding='utf8') as fp:
+        assert load(fp)['id'] == 12345678901234567890123
+
+
+def test_load_parse_dates(tmp_path):
+    p = tmp_path / 'test.json'
+    p.write_text(
+        '{"d": "2012-12-12T20:12:12.12", "l": ["2012-12-12T20:12:12.12", 1], '
+        '"o": [{"d": "2012-12-12T20:12:12.12"}]}',
+        encoding='utf8')
+    res = load(p, parse_dates=True)
+    assert res['d'].year == res['l'][0].year == res['o'][0]['d'].year == 2012
+    assert load(p)['d'] == '2012-12-12T20:12:12.12'
+
+
+def test_update_atomic(tmp_path):
+    p = tmp_path / 'test.json'
+    with update(p, default={}) as obj:
+        obj['a'] = 1
+
+    with pytest.raises(TypeError):
+        with update(p) as obj:
+            obj['a'] = object()
+    assert load(p) == {'a': 1}
+    assert [pp.name for pp in tmp_path.iterdir()] == ['test.json']
+
+
+def test_update_symlink(tmp_path):
+    target = tmp_path / 'test.json'
+    dump({'a': 1}, target)
+    link = tmp_path / 'link.json'
+    link.symlink_to(target)
+    with update(link) as obj:
+        obj['a'] = 2
+    assert link.is_symlink()
+    assert load(target) == {'a': 2}
+
+
+def test_update_mode(tmp_path):
+    p = tmp_path / 'test.json'
+    dump({'a': 1}, p)
+    p.chmod(0o600)
+    with update(p) as obj:
+        obj['a'] = 2
+    assert load(p) == {'a': 2}
+    assert stat.S_IMODE(p.stat().st_mode) == 0o600
+
+
+def test_update_new_file_mode(tmp_path):
+    p = tmp_path / 'test.json'
+    with update(p, default={}) as obj:
+        obj['a'] = 1
+    p2 = tmp_path / 'test2.json'
+    p2.write_text('{}', encoding='utf8')
+    assert stat.S_IMODE(p.stat().st_mode) == stat.S_IMODE(p2.stat().st_mode)
+
+
+def test_update_concurrent(tmp_path):
+    p = tmp_path / 'test.json'
+    dump({}, p)
+
+    def upd(i):
+        for _ in range(20):
+            with update(p) as obj:
+                obj[str(i)] = i
+            assert isinstance(load(p), dict)
+
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        list(executor.map(upd, range(4)))
+    assert [pp.name for pp in tmp_path.iterdir()] == ['test.json']
+
+
+def test_async(tmp_path):
+    p = tmp_path / 'test.json'
+
+    async def roundtrip():
+        await adump({'a': 1}, p, indent=2)
+        return await aload(p)
+
+    assert asyncio.run(roundtrip()) == {'a': 1}
+
+
+def test_load_threaded(tmp_path):
+    paths = []
+    for i in range(5):
+        paths.append(tmp_path / '{}.json'.format(i))
+        dump({'i': i}, paths[-1])
+    futures = [load_threaded(p) for p in paths]
+    assert [f.result() for f in futures] == [{'i': i} for i in range(5)]
+    assert load_threaded(str(paths[0]), object_pairs_hook=list).result() == [('i', 0)]
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+@pytest.mark.parametrize(
+    'kw',
+    [
+        dict(ensure_ascii=False, separators=(',', ':')),
+        dict(ensure_ascii=False, separators=(',', ':'), default=format),
+        dict(ensure_ascii=False, separators=(',', ':'), sort_keys=True),
+        dict(ensure_ascii=False, indent=2),
+        dict(ensure_ascii=False, indent='  ', separators=(',', ': '), sort_keys=True),
+        dict(ensure_ascii=False, indent=4),
+        dict(ensure_ascii=False, cls=json.JSONEncoder),
+        dict(ensure_ascii=False),
+        dict(),
+    ]
+)
+def test_dump(tmp_path, use_orjson, kw):
+    if use_orjson:
+        pytest.importorskip('orjson')
+    p = tmp_path / 'test.json'
+    obj = {'a': [1, 2.5, None, True, []], 'ä': 'ö"\n', 'b': {}, 'c': {'x': 1, 'a': 2}}
+    if 'default' in kw:
+        obj['d'] = date.today()
+    dump(obj, p, use_orjson=use_orjson, **kw)
+    assert p.read_text(encoding='utf8') == json.dumps(obj, **kw)
+
+    obj['a'].append(2 ** 70)
+    dump(obj, p, use_orjson=use_orjson, **kw)
+    assert p.read_text(encoding='utf8') == json.dumps(obj, **kw)
+
+
+@pytest.mark.parametrize(
+    'kw',
+    [
+        dict(ensure_ascii=False, separators=(',', ':'), default=repr),
+        dict(ensure_ascii=False, indent=2, default=repr),
+        dict(ensure_ascii=False, indent=2, sort_keys=True, default=repr),
+    ]
+)
+def test_dump_stdlib_output(tmp_path, kw):
+    @dataclasses.dataclass
+    class Point:
+        x: int
+
+    p = tmp_path / 'test.json'
+    obj = {'nan': float('nan'), 'inf': float('inf'), 'ninf': float('-inf'), 'f': 1e-7}
+    dump(obj, p, **kw)
+    assert p.read_text(encoding='utf8') == json.dumps(obj, **kw)
+
+    obj = {'p': Point(1)}
+    dump(obj, p, **kw)
+    assert p.read_text(encoding='utf8') == json.dumps(obj, **kw)
+    if importlib.util.find_spec('orjson'):
+        # default is honored for dataclasses when serializing with orjson, too:
+        dump(obj, p, use_orjson=True, **kw)
+        assert p.read_text(encoding='utf8') == json.dumps(obj, **kw)
+
+
+def test_dump_orjson_not_installed(tmp_path, mocker):
+    mocker.patch('clldutils.jsonlib.orjson', None)
+    p = tmp_path / 'test.json'
+    dump({'a': 1e-7}, p, use_orjson=True, ensure_ascii=False, separators=(',', ':'))
+    assert p.read_text(encoding='utf8') == '{"a":1e-07}'
@@ -1,11 +1,69 @@
-from clldutils.licenses import find
+import time
+import types
+import concurrent.futures
+
+import pytest
+
+from clldutils.licenses import find, find_all
 
 
 def test_find():
     assert find('http://creativecommons.org/licenses/by/4.0').id == 'CC-BY-4.0'
     assert find('CC-BY-4.0').url == 'https://creativecommons.org/licenses/by/4.0/'
+    assert find('https://creativecommons.org/licenses/by/4.0/legalcode').id == 'CC-BY-4.0'
+    assert find('Creative Commons Attribution 4.0').id == 'CC-BY-4.0'
+    assert find('unknown') is None
+    assert find('http://creativecommons.org').id == 'CC-BY-1.0'
+    assert find('http://unknown.org') is None
+
+
+@pytest.mark.parametrize(
+    'text,ids',
+    [
+        ('', []),
+        ('SUBMIT the Creative Commons License', []),
+        ('Licensed under CC-BY-4.0 or the MIT license.', ['CC-BY-4.0', 'MIT']),
+        ('MIT, see http://creativecommons.org/licenses/by/4.0/ and '
+         'Creative Commons Attribution 4.0, or MIT', ['MIT', 'CC-BY-4.0']),
+        ('CC-BY-4.0-x CC-BY-NC-4.0', ['CC-BY-NC-4.0']),
+    ]
+)
+def test_find_all(text, ids):
+    assert [lic.id for lic in find_all(text)] == ids
 
 
 def test_legalcode():
     assert find('cc-by-4.0').legalcode
     assert find('Zlib').legalcode is None
+
+
+def test_licenses_map():
+    from clldutils.licenses import _LICENSES
+
+    assert len(_LICENSES) == len(list(_LICENSES)) > 200
+    assert _LICENSES['MPL-2.0'].name == 'Mozilla Public License 2.0'
+    assert 'MIT' in _LICENSES and 'xyz' not in _LICENSES and '~' not in _LICENSES
+    assert 1 not in _LICENSES and _LICENSES.get(None) is None
+
+
+def test_licenses_map_concurrent_first_access(mocker):
+    from clldutils import licenses
+
+    def intern(s):
+        time.sleep(0.001)  # Give other threads a chance to run while the data is being read.
+        return s
+
+    mocker.patch.object(licenses, 'sys', types.SimpleNamespace(intern=intern))
+    lmap = licenses._LicenseMap(licenses._LICENSES._path)
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        res = list(executor.map(lambda _: lmap['MIT'].id, range(4)))
+    assert res == ['MIT'] * 4
+
+
+def test_urls():
+    from clldutils.licenses import _LICENSES
+
+    for lic in _LICENSES.values():
+        assert lic.url == lic.url.strip() and len(lic.url.split()) == 1
+    assert find('http://landley.net/toybox/license.html').id == '0BSD'
+    assert find('http://www.mozilla.org/MPL/2.0/').id == 'MPL-2.0'
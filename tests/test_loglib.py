@@ -29,3 +29,13 @@ def test_Logging_context_manager(capsys):
     run()
     out, err = capsys.readouterr()
     assert out.split() == ['warn', 'debug2']
+
+
+def test_get_colorlog_basicConfig(mocker):
+    basicConfig = mocker.patch('logging.basicConfig')
+    get_colorlog(__name__ + '.1', sys.stdout)
+    assert not basicConfig.called
+
+    mocker.patch.object(logging.root, 'handlers', [])
+    get_colorlog(__name__ + '.2', sys.stdout, level=logging.DEBUG)
+    basicConfig.assert_called_once_with(level=logging.DEBUG)
@@ -2,6 +2,7 @@ import io
 import re
 from operator import itemgetter
 
+import attr
 import pytest
 
 from clldutils.markup import *
@@ -112,6 +113,12 @@ def test_markdownlink():
     ml = MarkdownLink.from_string(s)
     assert ml.parsed_url_query['x'] == ['1'] and ml.label == 'y'
 
+    ml.url = 'https://example.org/p'
+    assert ml.parsed_url.netloc == 'example.org'
+    assert ml == MarkdownLink(label='y', url='https://example.org/p')
+    assert attr.asdict(ml) == {'label': 'y', 'url': 'https://example.org/p'}
+    assert attr.astuple(MarkdownImageLink('a', 'b')) == ('a', 'b')
+
     with pytest.raises(ValueError):
         MarkdownLink.from_string(str(MarkdownImageLink(label='x', url='y')))
 
@@ -119,7 +126,36 @@ def test_markdownlink():
     assert MarkdownLink.replace(s, lambda m: None) == s
 
 
-def test_markdownlink_ext():
+def test_markdownlink_replace_url():
+    md = 'x [a](b) ![c](d) [e](f)'
+    assert MarkdownLink.replace_url(md, lambda url: None if url == 'f' else url + 'x') == \
+        'x [a](bx) ![c](d) [e](f)'
+    assert MarkdownImageLink.replace_url(md, lambda url: 'y') == 'x [a](b) ![c](y) [e](f)'
+
+
+@pytest.mark.parametrize(
+    'md,link,image,expected',
+    [
+        ('[a](b) ![c](d)', True, True, '[a](x) ![c](y)'),
+        ('!![c](d) [a](b)', True, False, '!![c](d) [a](x)'),
+        ('[a](b) ![c](d)', False, True, '[a](b) ![c](y)'),
+        ('[a](b) ![c](d)', False, False, '[a](b) ![c](d)'),
+    ]
+)
+def test_markdownlink_replace_all(md, link, image, expected):
+    def repl(path):
+        return lambda ml: ml.update_url(path=path)
+
+    assert MarkdownLink.replace_all(
+        md, repl('x') if link else None, repl('y') if image else None) == expected
+    assert MarkdownLink.replace_all(md, lambda ml: None, lambda ml: None) == md
+    # Results are the same as when replacing links and image links separately:
+    assert expected == MarkdownImageLink.replace(
+        MarkdownLink.replace(md, repl('x') if link else lambda ml: None),
+        repl('y') if image else lambda ml: None)
+
+
+def test_markdownlink_ext(mocker):
     def repl(ml):
         ml.url = 'xyz'
         return ml
@@ -143,6 +179,27 @@ def test_markdownlink_ext():
     s = MarkdownLink.replace(md, repl, simple=False, markdown_kw=dict(extensions=['fenced_code']))
     assert s.count('xyz') == 2
 
+    s = MarkdownLink.replace(md, repl, simple=False, markdown_kw=dict(
+        extensions=['fenced_code'], extension_configs={'fenced_code': {}}))
+    assert s.count('xyz') == 2
+
+    mocker.patch('clldutils.markup._MARKDOWN_CACHE_MAX_SIZE', 0)
+    s = MarkdownLink.replace(md, repl, simple=False, markdown_kw=dict(extensions=['fenced_code']))
+    assert s.count('xyz') == 2
+
+    # TypeErrors raised during conversion are not mistaken for unhashable keyword arguments:
+    mocker.patch('clldutils.markup._MARKDOWN_CACHE_MAX_SIZE', 1 << 20)
+    to_html = mocker.patch('clldutils.markup._markdown_to_html', side_effect=TypeError)
+    with pytest.raises(TypeError):
+        MarkdownLink.replace(md + ' ', repl, simple=False)
+    assert to_html.call_count == 1
+    mocker.stopall()
+
+    md = 'No links, just ![an image](b)'
+    markdown = mocker.patch('markdown.markdown')
+    assert MarkdownLink.replace(md, repl, simple=False) == md
+    assert not markdown.called
+
 
 def test_markdownimagelink_ext():
     def repl(ml):
@@ -16,3 +16,17 @@ def test_defaults():
 def test_license_lookup():
     lic = License(name='CC-BY-4.0')
     assert lic.url == 'https://creativecommons.org/licenses/by/4.0/'
+    assert License(name='CC-BY-4.0') == lic
+
+
+def test_default_objects_not_shared():
+    md1, md2 = Metadata(), Metadata()
+    md1.publisher.name = 'x'
+    assert md2.publisher.name is None
+
+
+def test_domain():
+    md = Metadata(url='http://example.org/x')
+    assert md.domain == 'example.org'
+    md.url = 'https://example.com'
+    assert md.domain == 'example.com'
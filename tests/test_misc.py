@@ -1,3 +1,4 @@
+import base64
 import itertools
 import warnings
 
@@ -69,6 +70,7 @@ def test_NoDefault():
 
 def test_slug():
     assert slug('A B. \xe4C') == 'abac'
+    assert slug('A B.') == 'ab'
 
 
 def test_format_size():
@@ -79,6 +81,7 @@ def test_format_size():
 def test_xmlchars():
     assert xmlchars('äöü') == 'äöü'
     assert xmlchars('ä\x08') == 'ä'
+    assert xmlchars('a\x08\tb\x1f') == 'a\tb'
 
 
 def test_UnicodeMixin(recwarn):
@@ -98,3 +101,22 @@ def test_data_url_from_string():
     assert data_url('ü') == 'data:application/octet-stream;base64,w7w='
     assert data_url(Path(__file__)).startswith('data:')
     assert data_url(Path(__file__), mimetype='text/plain').startswith('data:text/plain')
+
+
+def test_data_url_chunked(tmp_path, mocker):
+    p = tmp_path / 'test.bin'
+    p.write_bytes(b'abcdefgh')
+    mocker.patch('clldutils.misc._DATA_URL_CHUNK_SIZE', 3)
+    assert data_url(p) == data_url(b'abcdefgh') == \
+        'data:application/octet-stream;base64,YWJjZGVmZ2g='
+
+
+def test_data_url_pybase64(tmp_path, mocker):
+    pytest.importorskip('pybase64')
+    content = bytes(range(256)) * 100
+    p = tmp_path / 'test.bin'
+    p.write_bytes(content)
+    mocker.patch('clldutils.misc._DATA_URL_CHUNK_SIZE', 3 * 1000)
+    res = [data_url(content), data_url(p), data_url('ü'), data_url(b'')]
+    mocker.patch('clldutils.misc._b64encode', lambda s: base64.b64encode(s).decode())
+    assert res == [data_url(content), data_url(p), data_url('ü'), data_url(b'')]
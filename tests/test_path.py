@@ -19,6 +19,8 @@ def test_Manifest(tmp_path):
     m = {k: v for k, v in Manifest.from_dir(d).items()}
     shutil.copytree(d, tmp_path / 'd')
     assert m == Manifest.from_dir(tmp_path / 'd')
+    assert m == Manifest.from_dir(tmp_path / 'd', max_workers=1)
+    assert m == Manifest.from_dir(tmp_path / 'd', max_workers=3)
     shutil.copytree(d, tmp_path / 'd' / 'd')
     assert m != Manifest.from_dir(tmp_path / 'd')
 
@@ -106,10 +108,13 @@ def test_as_posix():
     assert as_posix('.') == as_posix(Path('.'))
 
 
-def test_md5():
+def test_md5(mocker):
     from clldutils.path import md5
 
-    assert re.match('[a-f0-9]{32}$', md5(__file__))
+    res = md5(__file__)
+    assert re.match('[a-f0-9]{32}$', res)
+    mocker.patch('clldutils.path._MD5_MMAP_THRESHOLD', 0)
+    assert md5(__file__) == res
 
 
 def test_copytree(tmp_path):